@@ -0,0 +1,14 @@
+"""
+Entry point for the ``cron-scanner`` console script and ``python -m cron_scanner``.
+"""
+
+import sys
+
+def main() -> int:
+    """Run the Cron Scanner CLI."""
+    # Deferred so that importing this module to resolve the entry point stays cheap
+    from .scanner import main as scanner_main
+    return scanner_main()
+
+if __name__ == "__main__":
+    sys.exit(main())
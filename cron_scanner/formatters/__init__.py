@@ -1,13 +1,27 @@
 """Formatters for different output formats."""
 
+import importlib
+
 from .base import BaseFormatter
 from .csv_formatter import CSVFormatter
 from .json_formatter import JSONFormatter
-from .xlsx_formatter import XLSXFormatter
 from .text_formatter import TextFormatter
-from .pdf_formatter import PDFFormatter
 from .markdown_formatter import MarkdownFormatter
 
+# Formatters backed by heavy third-party libraries are imported on first access (PEP 562)
+_LAZY = {
+    'XLSXFormatter': ('.xlsx_formatter', 'XLSXFormatter'),
+    'PDFFormatter': ('.pdf_formatter', 'PDFFormatter'),
+}
+
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'BaseFormatter',
     'CSVFormatter',
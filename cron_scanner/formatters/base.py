@@ -1,7 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from functools import lru_cache
+from itertools import islice
+from pathlib import PurePath
+from typing import List, Dict, Any, Iterable, Optional, TextIO, Tuple, Union
 import os
 
+# Buffer size for formatter output files; large enough to keep multi-MB reports to a few syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Largest slice handed to a single os.write() call
+WRITE_CHUNK_SIZE = 1 << 20
+
+# Outputs with more entries than this are streamed instead of rendered in memory first
+STREAM_THRESHOLD = 10000
+
+# Number of rendered rows joined into one block per write when streaming
+STREAM_BLOCK_ROWS = 1000
+
 # Canonical column order used across output formats
 CANONICAL_FIELDS: List[str] = [
     'schedule',
@@ -13,6 +28,11 @@ CANONICAL_FIELDS: List[str] = [
     'line_content',
 ]
 
+_CANONICAL_SET = frozenset(CANONICAL_FIELDS)
+
+# Shared default for missing cell values
+EMPTY = ""
+
 # Shared mapping from data keys to human-readable column labels (for non-JSON outputs)
 HEADER_TITLE_MAP: Dict[str, str] = {
     'schedule': 'Schedule',
@@ -29,39 +49,122 @@ def get_all_fields(entries: List[Dict[str, Any]]) -> List[str]:
     Build a stable union of field names encountered in entries,
     preferring the canonical ordering.
     """
+    # Fast path: no entry carries a key outside the canonical set (the usual case),
+    # so the answer is the canonical order and no per-key scan is needed
+    if all(entry.keys() <= _CANONICAL_SET for entry in entries):
+        return list(CANONICAL_FIELDS)
+
     all_fields = list(CANONICAL_FIELDS)
+    seen = set(all_fields)
     for entry in entries:
-        for k in entry.keys():
-            if k not in all_fields:
+        for k in entry:
+            if k not in seen:
+                seen.add(k)
                 all_fields.append(k)
     return all_fields
 
-def humanize_headers(fields: List[str]) -> List[str]:
-    """Convert data field names into human-readable column labels."""
-    return [HEADER_TITLE_MAP.get(f, f.replace('_', ' ').title()) for f in fields]
+@lru_cache(maxsize=64)
+def humanize_headers(fields: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Convert data field names into human-readable column labels.
+
+    Results are memoized, so fields must be passed as a tuple.
+    """
+    return tuple(HEADER_TITLE_MAP.get(f, f.replace('_', ' ').title()) for f in fields)
 
 
 class BaseFormatter(ABC):
     """Base class for all formatters."""
     
     @abstractmethod
-    def format(self, entries: List[Dict[str, Any]], output_path: str = None) -> str:
+    def format(self,
+               entries: List[Dict[str, Any]],
+               output_path: str = None,
+               fields: Optional[List[str]] = None) -> str:
         """
         Format the cron entries.
         
         Args:
             entries: List of cron entries to format
             output_path: Path to save the formatted output. If None, return as string.
+            fields: Precomputed field order (see get_all_fields). If None, derived from entries.
             
         Returns:
             str: Formatted output or path to the output file
         """
         pass
     
+    def format_bytes(self,
+                     entries: List[Dict[str, Any]],
+                     fields: Optional[List[str]] = None) -> bytes:
+        """
+        Format the cron entries as UTF-8 encoded bytes.
+
+        Formatters that can render straight to bytes override this to skip the
+        str round trip; the default encodes the result of format().
+
+        Args:
+            entries: List of cron entries to format
+            fields: Precomputed field order (see get_all_fields). If None, derived from entries.
+
+        Returns:
+            bytes: Formatted output encoded as UTF-8
+        """
+        return self.format(entries, fields=fields).encode('utf-8')
+
     def _ensure_extension(self, path: str, extension: str) -> str:
-        """Ensure the output path has the correct extension."""
-        if not path.endswith(f".{extension}"):
-            if not path.endswith('.'):
-                path += '.'
-            path += extension
-        return path
+        """Ensure the output path has the correct extension.
+
+        An existing different suffix is kept (``cron.report`` becomes
+        ``cron.report.csv``), and a trailing dot is not doubled.
+        """
+        p = PurePath(path)
+        if p.suffix == f".{extension}":
+            return path
+        name = p.name[:-1] if p.name.endswith('.') else p.name
+        return str(p.with_name(f"{name}.{extension}"))
+
+    def _open_buffered(self, path: str, newline: Optional[str] = None) -> TextIO:
+        """
+        Open a UTF-8 text file for writing behind a large write buffer.
+
+        The returned file object is a context manager; the underlying
+        BufferedWriter uses WRITE_BUFFER_SIZE instead of the 8 KiB default.
+        """
+        return open(path, 'w', buffering=WRITE_BUFFER_SIZE, encoding='utf-8', newline=newline)
+
+    def _write_bytes(self, path: str, data: Union[bytes, bytearray]) -> None:
+        """Write a pre-rendered buffer to path with as few os.write() calls as possible."""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(path, flags, 0o666)
+        try:
+            view = memoryview(data)
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:written + WRITE_CHUNK_SIZE])
+        finally:
+            os.close(fd)
+
+    def _encode_chunks(self, chunks: Iterable[str]) -> bytearray:
+        """Encode text chunks straight into one growing buffer instead of joining a str first."""
+        buf = bytearray()
+        for chunk in chunks:
+            buf += chunk.encode('utf-8')
+        return buf
+
+    def _write_text(self, path: str, chunks: Iterable[str], count: int) -> None:
+        """
+        Write rendered text chunks to path as UTF-8, without newline translation.
+
+        Outputs for up to STREAM_THRESHOLD entries are encoded into a single
+        bytearray and written in one go via _write_bytes(); larger ones are
+        streamed through _open_buffered() in blocks of STREAM_BLOCK_ROWS chunks,
+        so the whole document never sits in memory.
+        """
+        if count <= STREAM_THRESHOLD:
+            self._write_bytes(path, self._encode_chunks(chunks))
+        else:
+            # Join rows into blocks so each write() hands the text layer a large string
+            it = iter(chunks)
+            with self._open_buffered(path, newline='') as f:
+                for block in iter(lambda: "".join(islice(it, STREAM_BLOCK_ROWS)), ""):
+                    f.write(block)
@@ -1,43 +1,119 @@
 import csv
+import io
 import os
-from typing import List, Dict, Any
-from .base import BaseFormatter, get_all_fields, humanize_headers
+import re
+from itertools import chain
+from typing import List, Dict, Any, Callable, Iterator, Sequence, Tuple, Optional
+from .base import BaseFormatter, EMPTY, get_all_fields, humanize_headers
+
+# Characters that force csv.writer (QUOTE_MINIMAL) to quote a field
+_CSV_SPECIAL_RE = re.compile(r'[,"\r\n]')
+
+# Generated row functions, keyed by the field tuple they were built for
+_ROW_FN_CACHE: Dict[Tuple[str, ...], Callable[[Dict[str, Any]], str]] = {}
+
+
+def _csv_esc(value: Any) -> str:
+    """Render a single value as a CSV cell, quoting it the way csv.writer's QUOTE_MINIMAL would."""
+    if value is None:
+        return ""
+    s = str(value)
+    if _CSV_SPECIAL_RE.search(s):
+        return '"' + s.replace('"', '""') + '"'
+    return s
+
+
+def _row_function(fields: Tuple[str, ...]) -> Callable[[Dict[str, Any]], str]:
+    """
+    Return a function rendering one entry as a CSV line for the given fields.
+
+    The function is generated as straight-line code, so there is no per-field
+    loop or dispatch when rendering a row.
+    """
+    fn = _ROW_FN_CACHE.get(fields)
+    if fn is None:
+        cells = ", ".join(f"_esc(get({field!r}, ''))" for field in fields)
+        source = (
+            "def _row(entry):\n"
+            "    get = entry.get\n"
+            f"    return ','.join(({cells},)) + '\\r\\n'\n"
+        )
+        namespace: Dict[str, Any] = {}
+        exec(source, {'_esc': _csv_esc}, namespace)
+        fn = _ROW_FN_CACHE[fields] = namespace['_row']
+    return fn
+
 
 class CSVFormatter(BaseFormatter):
     """Formatter for CSV output."""
-    
-    def format(self, entries: List[Dict[str, Any]], output_path: str = None) -> str:
+
+    def __init__(self, fast_path: bool = True):
+        """
+        Initialize the CSVFormatter.
+
+        Args:
+            fast_path: When True, rows are rendered by a generated row function
+                instead of going through the csv module
+        """
+        self.fast_path = fast_path
+
+    def format(self,
+               entries: List[Dict[str, Any]],
+               output_path: str = None,
+               fields: Optional[List[str]] = None) -> str:
         """
         Format cron entries as CSV.
-        
+
         Args:
             entries: List of cron entries
             output_path: Path to save the CSV file. If None, return as string.
-            
+            fields: Precomputed field order (see get_all_fields). If None, derived from entries.
+
         Returns:
             str: CSV content or path to the CSV file
         """
         # Build a stable union of fieldnames across all entries using shared helper
-        fieldnames = get_all_fields(entries)
-        header_labels = humanize_headers(fieldnames)
-        
+        fieldnames = fields if fields is not None else get_all_fields(entries)
+        header_labels = humanize_headers(tuple(fieldnames))
+
+        if not output_path and not entries:
+            return ""
+
+        lines = self._iter_lines(entries, fieldnames, header_labels)
         if output_path:
             output_path = self._ensure_extension(output_path, 'csv')
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                # Always write header row with human-readable labels
-                writer.writerow(header_labels)
-                # Write rows in field order
-                for entry in entries:
-                    writer.writerow([entry.get(field, "") for field in fieldnames])
+            self._write_text(output_path, lines, len(entries))
             return output_path
         else:
-            if not entries:
-                return ""
-            import io
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(header_labels)
-            for entry in entries:
-                writer.writerow([entry.get(field, "") for field in fieldnames])
-            return output.getvalue()
+            return "".join(lines)
+
+    def format_bytes(self,
+                     entries: List[Dict[str, Any]],
+                     fields: Optional[List[str]] = None) -> bytes:
+        """Format cron entries as UTF-8 encoded CSV without building an intermediate str."""
+        if not entries:
+            return b""
+        fieldnames = fields if fields is not None else get_all_fields(entries)
+        header_labels = humanize_headers(tuple(fieldnames))
+        return bytes(self._encode_chunks(self._iter_lines(entries, fieldnames, header_labels)))
+
+    def _iter_lines(self,
+                    entries: List[Dict[str, Any]],
+                    fieldnames: List[str],
+                    header_labels: Sequence[str]) -> Iterator[str]:
+        """Yield the header and then each entry as a CSV line, including the line terminator."""
+        if self.fast_path:
+            # Always lead with the header row (human-readable labels), then rows in field order
+            yield ",".join(map(_csv_esc, header_labels)) + "\r\n"
+            yield from map(_row_function(tuple(fieldnames)), entries)
+            return
+
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        _dget = dict.get
+        rows = ([_dget(entry, field, EMPTY) for field in fieldnames] for entry in entries)
+        for row in chain([header_labels], rows):
+            writer.writerow(row)
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
@@ -1,26 +1,54 @@
 import json
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from .base import BaseFormatter
 
+try:
+    import orjson  # type: ignore
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+    _HAS_ORJSON = False
+
 class JSONFormatter(BaseFormatter):
     """Formatter for JSON output."""
-    
-    def format(self, entries: List[Dict[str, Any]], output_path: str = None) -> str:
+
+    def format(self,
+               entries: List[Dict[str, Any]],
+               output_path: str = None,
+               fields: Optional[List[str]] = None) -> str:
         """
         Format cron entries as JSON.
-        
+
+        Uses orjson when it is installed (the optional 'fast' extra) and falls
+        back to the standard library json module otherwise. Both write
+        non-ASCII characters as UTF-8 rather than \\u escapes, so the output
+        is identical either way.
+
         Args:
             entries: List of cron entries
             output_path: Path to save the JSON file. If None, return as string.
-            
+            fields: Accepted for interface compatibility; JSON keeps each entry's own keys
+
         Returns:
             str: JSON content or path to the JSON file
         """
+        data = self.format_bytes(entries, fields)
         if output_path:
             output_path = self._ensure_extension(output_path, 'json')
-            with open(output_path, 'w') as f:
-                json.dump(entries, f, indent=2)
+            self._write_bytes(output_path, data)
             return output_path
         else:
-            return json.dumps(entries, indent=2)
+            return data.decode('utf-8')
+
+    def format_bytes(self,
+                     entries: List[Dict[str, Any]],
+                     fields: Optional[List[str]] = None) -> bytes:
+        """Format cron entries as UTF-8 encoded JSON; with orjson this needs no str at all.
+
+        fields is accepted for interface compatibility; JSON keeps each entry's own keys.
+        """
+        if _HAS_ORJSON:
+            return orjson.dumps(entries, option=orjson.OPT_INDENT_2)
+        # ensure_ascii=False matches orjson, which never escapes non-ASCII
+        return json.dumps(entries, indent=2, ensure_ascii=False).encode('utf-8')
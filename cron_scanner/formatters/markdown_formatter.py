@@ -1,59 +1,79 @@
 import os
-from typing import List, Dict, Any
-from .base import BaseFormatter, get_all_fields, humanize_headers
+from operator import itemgetter
+from typing import List, Dict, Any, Iterator, Optional
+from .base import BaseFormatter, EMPTY, get_all_fields, humanize_headers
+
+
+# Single-pass translation table: escape pipe and backslash, and turn newlines
+# into <br> so tables stay intact
+_MD_TRANS = str.maketrans({"\\": "\\\\", "|": "\\|", "\n": "<br>", "\r": "<br>"})
 
 
 def _escape_md(text: str) -> str:
     """Escape Markdown table special chars and normalize newlines."""
     if text is None:
         return ""
-    s = str(text)
-    # Escape pipe and backslash
-    s = s.replace("\\", "\\\\").replace("|", "\\|")
-    # Normalize newlines to <br> so tables stay intact
-    s = s.replace("\r\n", "<br>").replace("\n", "<br>")
-    return s
+    # Collapse CRLF first so it yields a single <br>
+    return str(text).replace("\r\n", "\n").translate(_MD_TRANS)
 
 
 class MarkdownFormatter(BaseFormatter):
     """Formatter for Markdown (.md) table output."""
 
-    def format(self, entries: List[Dict[str, Any]], output_path: str = None) -> str:
+    def format(self,
+               entries: List[Dict[str, Any]],
+               output_path: str = None,
+               fields: Optional[List[str]] = None) -> str:
         """
         Format cron entries as a Markdown table.
 
         Args:
             entries: List of cron entries
             output_path: Path to save the .md file. If None, return as string.
+            fields: Precomputed field order (see get_all_fields). If None, derived from entries.
 
         Returns:
             str: Markdown content or path to the .md file
         """
         # Build a stable union of field names using shared helper
-        all_fields = get_all_fields(entries)
+        all_fields = fields if fields is not None else get_all_fields(entries)
 
         if not entries and output_path is None:
             # Match CSV/Text behavior: return empty when no entries and no file is requested
             return ""
 
-        # Header (human-readable labels for non-JSON formats)
-        header_labels = humanize_headers(all_fields)
-        header_labels_esc = [_escape_md(h) for h in header_labels]
-        header = "| " + " | ".join(header_labels_esc) + " |"
-        separator = "| " + " | ".join(["---"] * len(all_fields)) + " |"
-
-        # Rows
-        rows: List[str] = []
-        for entry in entries:
-            row_vals = [_escape_md(entry.get(field, "")) for field in all_fields]
-            rows.append("| " + " | ".join(row_vals) + " |")
-
-        content = "\n".join([header, separator] + rows)
-
         if output_path:
             output_path = self._ensure_extension(output_path, 'md')
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            self._write_text(output_path, self._iter_lines(entries, all_fields), len(entries))
             return output_path
         else:
-            return content
+            return "".join(self._iter_lines(entries, all_fields))
+
+    def format_bytes(self,
+                     entries: List[Dict[str, Any]],
+                     fields: Optional[List[str]] = None) -> bytes:
+        """Format cron entries as a UTF-8 encoded Markdown table without an intermediate str."""
+        if not entries:
+            return b""
+        all_fields = fields if fields is not None else get_all_fields(entries)
+        return bytes(self._encode_chunks(self._iter_lines(entries, all_fields)))
+
+    def _iter_lines(self, entries: List[Dict[str, Any]], all_fields: List[str]) -> Iterator[str]:
+        """Yield the table header, separator and rows, each row prefixed by its newline."""
+        # Header (human-readable labels for non-JSON formats)
+        header_labels = humanize_headers(tuple(all_fields))
+        header_labels_esc = [_escape_md(h) for h in header_labels]
+        yield "| " + " | ".join(header_labels_esc) + " |"
+        yield "\n| " + " | ".join(["---"] * len(all_fields)) + " |"
+
+        # itemgetter pulls every column in one C call when an entry has all fields;
+        # with fewer than two fields it would not return a tuple, so skip it then
+        getter = itemgetter(*all_fields) if len(all_fields) > 1 else None
+        _dget = dict.get
+        all_fields_set = frozenset(all_fields)
+        for entry in entries:
+            if getter is not None and entry.keys() >= all_fields_set:
+                values = getter(entry)
+            else:
+                values = [_dget(entry, field, EMPTY) for field in all_fields]
+            yield "\n| " + " | ".join(map(_escape_md, values)) + " |"
@@ -1,31 +1,60 @@
 import os
-from typing import List, Dict, Any
-from .base import BaseFormatter, get_all_fields, humanize_headers
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from xml.sax.saxutils import escape
+from typing import List, Dict, Any, Tuple, Optional
+from .base import BaseFormatter, EMPTY, get_all_fields, humanize_headers
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    _HAS_REPORTLAB = True
+except ImportError:  # pragma: no cover - optional 'pdf' extra
+    _HAS_REPORTLAB = False
+
+# Horizontal padding applied on each side of a table cell
+CELL_PADDING = 4
+
+# Same replacements as xml.sax.saxutils.escape, applied in a single pass
+_XML_TRANS = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def _escape_xml(text: str) -> str:
+    """Escape &, < and > for use in reportlab Paragraph markup."""
+    return text.translate(_XML_TRANS)
+
+
+def _cell_text(raw: Any) -> str:
+    """Convert a cell value to display text; None renders as an empty cell."""
+    return "" if raw is None else str(raw)
+
 
 class PDFFormatter(BaseFormatter):
     """Formatter for PDF output."""
     
-    def format(self, entries: List[Dict[str, Any]], output_path: str = None) -> str:
+    def format(self,
+               entries: List[Dict[str, Any]],
+               output_path: str = None,
+               fields: Optional[List[str]] = None) -> str:
         """
         Format cron entries as a PDF file.
         
         Args:
             entries: List of cron entries
             output_path: Path to save the PDF file. If None, raises ValueError.
+            fields: Precomputed field order (see get_all_fields). If None, derived from entries.
             
         Returns:
             str: Path to the PDF file
             
         Raises:
             ValueError: If output_path is not provided
+            ImportError: If reportlab is not installed
         """
         if not output_path:
             raise ValueError("output_path is required for PDF formatter")
+        if not _HAS_REPORTLAB:
+            raise ImportError("PDF output requires reportlab; install it with: pip install 'cron-scanner[pdf]'")
             
         output_path = self._ensure_extension(output_path, 'pdf')
         
@@ -80,20 +109,7 @@ class PDFFormatter(BaseFormatter):
         # Prepare data for table
         if entries:
             # Build a stable union of field names using shared helper
-            all_fields = get_all_fields(entries)
-            
-            # Create table data
-            # Build human-friendly headers and wrap them to avoid overflow into adjacent cells
-            display_headers = humanize_headers(all_fields)
-            header_row = [Paragraph(escape(h), header_style) for h in display_headers]
-            table_data = [header_row]  # Header row
-            for entry in entries:
-                row = []
-                for field in all_fields:
-                    raw = entry.get(field, "")
-                    text = "" if raw is None else str(raw)
-                    row.append(Paragraph(escape(text), cell_style))
-                table_data.append(row)
+            all_fields = fields if fields is not None else get_all_fields(entries)
             
             # Calculate column widths to fit page width
             available_width = doc.width
@@ -109,7 +125,50 @@ class PDFFormatter(BaseFormatter):
             weights = [weight_map.get(field, 1.0) for field in all_fields]
             total_weight = sum(weights) if sum(weights) > 0 else 1.0
             col_widths = [available_width * (w / total_weight) for w in weights]
-            
+
+            _dget = dict.get
+            str_rows = [[_cell_text(_dget(entry, field, EMPTY)) for field in all_fields] for entry in entries]
+
+            # Paragraph construction and wrapping is expensive, so only wide-weight
+            # columns and columns whose longest value would overflow get Paragraphs;
+            # the rest are drawn as plain strings (which reportlab does not parse as markup)
+            text_width = CELL_PADDING * 2
+            needs_wrap = []
+            for idx, field in enumerate(all_fields):
+                needs_wrap.append(
+                    weights[idx] >= 2.0
+                    or any(
+                        '\n' in row[idx]
+                        or stringWidth(row[idx], cell_style.fontName, cell_style.fontSize) + text_width > col_widths[idx]
+                        for row in str_rows
+                    )
+                )
+
+            # Create table data
+            # Build human-friendly headers and wrap them to avoid overflow into adjacent cells
+            display_headers = humanize_headers(tuple(all_fields))
+            header_row = [Paragraph(_escape_xml(h), header_style) for h in display_headers]
+
+            # Cron dumps repeat the same commands, users and schedules many times,
+            # so escape each distinct value once and share Paragraphs per column.
+            # Sharing is safe: Table re-wraps a cell's flowable right before drawing it.
+            esc_cache: Dict[str, str] = {}
+            para_cache: Dict[Tuple[int, str], Paragraph] = {}
+
+            def wrapped_cell(idx: int, text: str) -> Paragraph:
+                escaped = esc_cache.get(text)
+                if escaped is None:
+                    escaped = esc_cache[text] = _escape_xml(text)
+                para = para_cache.get((idx, escaped))
+                if para is None:
+                    para = para_cache[(idx, escaped)] = Paragraph(escaped, cell_style)
+                return para
+
+            table_data = [header_row] + [
+                [wrapped_cell(idx, text) if needs_wrap[idx] else text for idx, text in enumerate(str_row)]
+                for str_row in str_rows
+            ]
+
             # Create the table with constrained width and repeated header
             table = Table(table_data, colWidths=col_widths, repeatRows=1)
             
@@ -128,21 +187,18 @@ class PDFFormatter(BaseFormatter):
                 ('BOX', (0, 0), (-1, -1), 1, colors.black),
                 ('VALIGN', (0, 0), (-1, -1), 'TOP'),
                 ('FONTSIZE', (0, 1), (-1, -1), 8),
+                # Plain-string cells use the same line height as Paragraph cells
+                ('LEADING', (0, 1), (-1, -1), 10),
                 # Slightly reduce padding to give text more room within narrow columns
-                ('LEFTPADDING', (0, 0), (-1, -1), 4),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+                ('LEFTPADDING', (0, 0), (-1, -1), CELL_PADDING),
+                ('RIGHTPADDING', (0, 0), (-1, -1), CELL_PADDING),
                 ('TOPPADDING', (0, 1), (-1, -1), 4),
                 ('BOTTOMPADDING', (0, 1), (-1, -1), 4),
             ])
             
-            # Alternate row colors
-            for i in range(1, len(table_data)):
-                if i % 2 == 0:
-                    bg_color = colors.lightgrey
-                else:
-                    bg_color = colors.white
-                style.add('BACKGROUND', (0, i), (-1, i), bg_color)
-            
+            # Alternate row colors (white, light grey, ...) with a single native command
+            style.add('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
+
             table.setStyle(style)
             elements.append(table)
         
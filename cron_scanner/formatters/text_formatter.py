@@ -1,17 +1,25 @@
 import os
-from typing import List, Dict, Any
-from .base import BaseFormatter, get_all_fields, humanize_headers
+from itertools import chain
+from typing import List, Dict, Any, Iterator, Sequence, Optional
+from .base import BaseFormatter, EMPTY, get_all_fields, humanize_headers
 
 class TextFormatter(BaseFormatter):
     """Formatter for plain text output."""
     
-    def format(self, entries: List[Dict[str, Any]], output_path: str = None) -> str:
+    def format(self,
+               entries: List[Dict[str, Any]],
+               output_path: str = None,
+               fields: Optional[List[str]] = None) -> str:
         """
         Format cron entries as plain text.
+
+        Lines are rendered lazily; when writing to a file, large outputs are
+        streamed through a buffered handle rather than joined into one string.
         
         Args:
             entries: List of cron entries
             output_path: Path to save the text file. If None, return as string.
+            fields: Precomputed field order (see get_all_fields). If None, derived from entries.
             
         Returns:
             str: Formatted text or path to the text file
@@ -20,43 +28,35 @@ class TextFormatter(BaseFormatter):
             return ""
             
         # Use shared canonical union for consistent ordering
-        all_fields = get_all_fields(entries)
-        header_labels = humanize_headers(all_fields)
-        
-        # Find the maximum width for each column considering header labels and values
-        field_widths: Dict[str, int] = {}
-        for idx, field in enumerate(all_fields):
-            max_len = len(str(header_labels[idx]))
-            for entry in entries:
-                if field in entry:
-                    max_len = max(max_len, len(str(entry[field])))
-            field_widths[field] = max_len + 2  # Add some padding
-            
-        # Build the format string
-        format_str = "".join(
-            f"{{:<{field_widths[field]}.{field_widths[field]-2}}}" for field in all_fields
-        )
-        
-        # Build the output
-        output = []
-        # Header (human-readable labels)
-        output.append(format_str.format(*header_labels))
-        # Separator
-        output.append("-" * sum(field_widths.values()))
-        
-        # Rows
-        for entry in entries:
-            row = []
-            for field in all_fields:
-                row.append(str(entry.get(field, "")))
-            output.append(format_str.format(*row))
-        
-        result = "\n".join(output)
+        all_fields = fields if fields is not None else get_all_fields(entries)
+        header_labels = humanize_headers(tuple(all_fields))
         
+        # Stringify every cell once, column by column; the same strings feed both
+        # the width pass and the output
+        _dget = dict.get
+        columns = [[str(_dget(entry, field, EMPTY)) for entry in entries] for field in all_fields]
+
+        # Find the maximum width for each column considering header labels and values,
+        # plus some padding. Widths already include the padding, so nothing is ever
+        # truncated and cells are padded with ljust rather than a per-row format string
+        widths = [max(map(len, chain((label,), column))) + 2
+                  for label, column in zip(header_labels, columns)]
+
+        def render(cells: Sequence[str]) -> str:
+            return "".join(map(str.ljust, cells, widths))
+
+        header = render(header_labels)
+        separator = "-" * sum(widths)
+
+        def lines() -> Iterator[str]:
+            yield header
+            yield "\n" + separator
+            for row in zip(*columns):
+                yield "\n" + render(row)
+
         if output_path:
             output_path = self._ensure_extension(output_path, 'txt')
-            with open(output_path, 'w') as f:
-                f.write(result)
+            self._write_text(output_path, lines(), len(entries))
             return output_path
         else:
-            return result
+            return "".join(lines())
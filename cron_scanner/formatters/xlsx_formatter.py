@@ -1,43 +1,87 @@
+import importlib.util
 import os
-from typing import List, Dict, Any
+import warnings
+from typing import List, Dict, Any, Iterable, Sequence, Optional
 from .base import BaseFormatter, get_all_fields, humanize_headers
 
+# Worksheet name, matching what pandas' to_excel produced before it was dropped
+SHEET_NAME = 'Sheet1'
+
 class XLSXFormatter(BaseFormatter):
     """Formatter for Excel (XLSX) output."""
     
-    def format(self, entries: List[Dict[str, Any]], output_path: str = None) -> str:
+    def format(self,
+               entries: List[Dict[str, Any]],
+               output_path: str = None,
+               fields: Optional[List[str]] = None) -> str:
         """
         Format cron entries as an Excel (XLSX) file.
         
         Args:
             entries: List of cron entries
             output_path: Path to save the XLSX file. If None, raises ValueError.
+            fields: Precomputed field order (see get_all_fields). If None, derived from entries.
             
         Returns:
             str: Path to the XLSX file
             
         Raises:
             ValueError: If output_path is not provided
+            ImportError: If neither PyExcelerate nor openpyxl is installed
         """
         if not output_path:
             raise ValueError("output_path is required for XLSX formatter")
             
         output_path = self._ensure_extension(output_path, 'xlsx')
         
-        import pandas as pd
         # Build consistent field order and human-readable headers
-        all_fields = get_all_fields(entries)
-        header_labels = humanize_headers(all_fields)
-
-        # Reindex DataFrame to use our field order and then rename columns to labels
-        df = pd.DataFrame(entries)
-        # Ensure all missing columns exist so reindex won't fail
-        for col in all_fields:
-            if col not in df.columns:
-                df[col] = ""
-        df = df[all_fields]
-        df.columns = header_labels
-
-        df.to_excel(output_path, index=False, engine='openpyxl')
-        
+        all_fields = fields if fields is not None else get_all_fields(entries)
+        header_labels = humanize_headers(tuple(all_fields))
+
+        # Raw row values; missing values stay None so they come out as blank cells
+        _dget = dict.get
+        rows = ([_dget(entry, field) for field in all_fields] for entry in entries)
+
+        try:
+            from pyexcelerate import Workbook
+        except ImportError:
+            self._write_with_openpyxl(header_labels, rows, output_path)
+            return output_path
+
+        # Write the header and all rows in one bulk call; no per-cell objects
+        wb = Workbook()
+        wb.new_sheet(SHEET_NAME, data=[list(header_labels)] + list(rows))
+        wb.save(output_path)
+
         return output_path
+
+    def _write_with_openpyxl(self,
+                             header_labels: Sequence[str],
+                             rows: Iterable[List[Any]],
+                             output_path: str) -> None:
+        """Fallback writer used when PyExcelerate is not installed.
+
+        Uses openpyxl's write-only mode, which streams rows out instead of
+        keeping a cell grid in memory.
+        """
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise ImportError(
+                "XLSX output requires openpyxl or pyexcelerate; "
+                "install them with: pip install 'cron-scanner[excel]'"
+            ) from None
+
+        if importlib.util.find_spec('lxml') is None:
+            warnings.warn(
+                "lxml is not installed; openpyxl XLSX export will be slower and use more memory",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(SHEET_NAME)
+        ws.append(list(header_labels))
+        for row in rows:
+            ws.append(row)
+        wb.save(output_path)
@@ -1,9 +1,11 @@
+import io
 import os
 import re
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from croniter import croniter
-from cron_descriptor import get_description as cron_get_description, Options as CronOptions
 import getpass
 import subprocess
 import shutil
@@ -13,24 +15,121 @@ try:
 except Exception:  # pragma: no cover - not available on non-Unix platforms
     pwd = None
 
+# Buffer size for reading crontab files; large /etc/cron.d bundles load in a few syscalls
+READ_BUFFER_SIZE = 1 << 17
+
+# Precompiled patterns used on every crontab line
+_WS_RE = re.compile(r'\s+')
+_ENV_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*\s*=')
+_USER_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_-]*$')
+_ASSIGN_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*=')
+_CMDTOK_RE = re.compile(r'^[A-Za-z0-9_.\-]+$')
+# Command tokenizer: quoted strings (unterminated ones run to the end), escapes, ';', '#', plain text.
+# As in the shell, a backslash escapes nothing inside single quotes.
+_CMD_TOKEN_RE = re.compile(r"""'[^']*'?|"(?:[^"\\]|\\.)*"?|\\.?|[#;]|[^'"\\#;]+""", re.S)
+
+# Standard 5-field equivalents of the time-based @ macros
+_SPECIAL_SCHEDULES = {
+    '@yearly': '0 0 1 1 *',
+    '@annually': '0 0 1 1 *',
+    '@monthly': '0 0 1 * *',
+    '@weekly': '0 0 * * 0',
+    '@daily': '0 0 * * *',
+    '@midnight': '0 0 * * *',
+    '@hourly': '0 * * * *',
+}
+
+@lru_cache(maxsize=512)
+def _expand_special(special: str) -> Optional[str]:
+    """Expand @ macros to standard 5-field expressions. Return None for non-time-based macros."""
+    if special == '@reboot':
+        return None
+    return _SPECIAL_SCHEDULES.get(special, special)
+
+@lru_cache(maxsize=512)
+def _describe_schedule(schedule: str) -> str:
+    """Return a human-readable description of a cron schedule.
+
+    Uses cron-descriptor with 24-hour time format. Supports @macros; returns a
+    friendly phrase for @reboot. Falls back to the raw schedule on error or when
+    cron-descriptor (the optional 'describe' extra) is not installed.
+    Memoized, since crontabs repeat the same few schedules many times.
+    """
+    try:
+        # Expand @macros except @reboot
+        if schedule.startswith('@'):
+            expanded = _expand_special(schedule)
+            if expanded is None:
+                return 'At reboot'
+            expr = expanded
+        else:
+            expr = schedule
+
+        # Imported here so runs that never describe a schedule don't load it
+        from cron_descriptor import get_description as cron_get_description, Options as CronOptions
+
+        options = CronOptions()
+        options.use_24hour_time_format = True
+        return cron_get_description(expr, options)
+    except Exception:
+        # Fallback to the schedule string if description cannot be generated
+        return schedule
+
+@lru_cache(maxsize=256)
+def _user_exists(name: str) -> bool:
+    """Return True if name is a known system user (cached: NSS lookups can hit LDAP/SSSD)."""
+    if pwd is None:
+        return False
+    try:
+        pwd.getpwnam(name)  # type: ignore
+        return True
+    except Exception:
+        return False
+
+@lru_cache(maxsize=1024)
+def _expand_expression(expr_format: str, args: Tuple, kwargs: Tuple) -> Any:
+    """Return croniter's expansion of a cron expression (memoized, shared by all parsers)."""
+    return croniter._expand(expr_format, *args, **dict(kwargs))
+
+class _ShimCroniter(croniter):
+    """croniter that takes expression expansions from _expand_expression instead of re-parsing.
+
+    croniter re-runs its regex-heavy expansion for every instance (and match()
+    builds one too). Expansions are only read afterwards, so they can be shared.
+    """
+
+    @classmethod
+    def _expand(cls, expr_format, *args, **kwargs):
+        # The signature differs between croniter releases; pass everything through
+        try:
+            return _expand_expression(expr_format, args, tuple(sorted(kwargs.items())))
+        except TypeError:
+            # Unhashable argument; expand without caching
+            return super()._expand(expr_format, *args, **kwargs)
+
 class CronParser:
     """Parser for crontab entries."""
     
-    def __init__(self, crontab_content: str = None, filename: str = None):
+    def __init__(self, crontab_content: str = None, filename: str = None, describe: bool = True):
         """
         Initialize the CronParser.
         
         Args:
             crontab_content: Raw crontab content as a string
             filename: Path to a crontab file
+            describe: Add a human-readable 'description' to each entry. Disabling it
+                skips cron-descriptor entirely and leaves the field out.
         """
         self.crontab_content = crontab_content
         self.filename = filename
+        self.describe = describe
         self.entries = []
         self.is_system_style = False  # Heuristic: cron files that include a username column
+        self._cached_user = self._current_user()  # Owner of entries without a username column
+        self._parsed = False
         
         if self.filename and os.path.exists(self.filename):
-            with open(self.filename, 'r') as f:
+            with open(self.filename, 'r', buffering=READ_BUFFER_SIZE) as f:
                 self.crontab_content = f.read()
             # Heuristic: files under /etc typically require a username column
             path = os.path.abspath(self.filename)
@@ -54,13 +153,14 @@ class CronParser:
         Returns:
             List[Dict[str, Any]]: List of parsed cron entries
         """
+        self._parsed = True
         if not self.crontab_content:
             return []
             
         self.entries = []
         
-        # Parse each line in the crontab
-        for line_num, line in enumerate(self.crontab_content.split('\n'), 1):
+        # Parse each line in the crontab; StringIO yields lines lazily instead of building a list
+        for line_num, line in enumerate(io.StringIO(self.crontab_content), 1):
             line = line.strip()
             
             # Skip empty lines and comments
@@ -76,7 +176,7 @@ class CronParser:
                     # @macro lines may include a username
                     if full_command:
                         # Split into first two tokens to test for username + command
-                        parts_after = re.split(r'\s+', full_command, maxsplit=2)
+                        parts_after = _WS_RE.split(full_command, maxsplit=2)
                         if parts_after:
                             candidate_user = parts_after[0]
                             next_token = parts_after[1] if len(parts_after) > 1 else ''
@@ -85,7 +185,7 @@ class CronParser:
                                 full_command = parts_after[2] if len(parts_after) > 2 else ''
                 else:
                     # Parse standard cron line (min hour dom month dow [username] command)
-                    tokens = re.split(r'\s+', line.strip())
+                    tokens = _WS_RE.split(line.strip())
                     if len(tokens) < 6:
                         # Might be an env var line like PATH=/usr/bin
                         if self._looks_like_env(line):
@@ -111,10 +211,7 @@ class CronParser:
                         # No username column expected; command starts after 5 schedule tokens
                         full_command = self._remainder_after_tokens(line, 5)
 
-                # Strip inline comments not within quotes
-                full_command = self._strip_inline_comment(full_command).strip()
-
-                # Split by semicolons into separate commands, respecting quotes
+                # Split by semicolons into separate commands and strip inline comments, respecting quotes
                 commands = self._split_commands(full_command)
 
                 for cmd in commands:
@@ -122,14 +219,14 @@ class CronParser:
                     if not cmd_clean:
                         continue
                     # Create a cron entry
-                    entry = {
-                        'schedule': schedule,
-                        'description': self._describe_schedule(schedule),
-                        'command': cmd_clean,
-                        'user': user if user else self._current_user(),
-                        'line_number': line_num,
-                        'line_content': line,
-                    }
+                    # The description, when wanted, goes right after the schedule
+                    entry = {'schedule': schedule}
+                    if self.describe:
+                        entry['description'] = _describe_schedule(schedule)
+                    entry['command'] = cmd_clean
+                    entry['user'] = user if user else self._cached_user
+                    entry['line_number'] = line_num
+                    entry['line_content'] = line
                     self.entries.append(entry)
                 
             except Exception as e:
@@ -157,30 +254,16 @@ class CronParser:
     
     def _looks_like_env(self, line: str) -> bool:
         """Return True if the line appears to be an environment variable assignment."""
-        return re.match(r'^[A-Za-z_][A-Za-z0-9_]*\s*=\s*.*$', line) is not None
+        return _ENV_RE.match(line) is not None
 
     def _is_valid_username(self, token: str) -> bool:
         """Check if a token is a valid system username (best-effort)."""
-        # If we heuristically know it's a system-style file and there are enough tokens, assume username
+        if _user_exists(token):
+            return True
+        # If we heuristically know it's a system-style file, accept any username-looking token
         if self.is_system_style:
-            try:
-                if pwd is not None:
-                    pwd.getpwnam(token)  # type: ignore
-                # If pwd is None (non-Unix), accept alnum/underscore/hyphen pattern
-                else:
-                    if not re.match(r'^[A-Za-z_][A-Za-z0-9_-]*$', token):
-                        return False
-                return True
-            except Exception:
-                # Fall back to pattern check
-                return re.match(r'^[A-Za-z_][A-Za-z0-9_-]*$', token) is not None
+            return _USER_RE.match(token) is not None
         # For user crontabs, only treat as username if it actually exists (avoids misclassification)
-        try:
-            if pwd is not None:
-                pwd.getpwnam(token)  # type: ignore
-                return True
-        except Exception:
-            pass
         return False
 
     def _looks_like_command_start(self, token: str) -> bool:
@@ -193,14 +276,14 @@ class CronParser:
         if token in {'sh', 'bash', 'zsh', 'python', 'python3', 'ruby', 'node', 'perl'}:
             return True
         # Looks like an assignment? Then not a command start
-        if re.match(r'^[A-Za-z_][A-Za-z0-9_]*=', token):
+        if _ASSIGN_RE.match(token):
             return False
         # Alphanumeric with typical command chars
-        return re.match(r'^[A-Za-z0-9_.\-]+$', token) is not None
+        return _CMDTOK_RE.match(token) is not None
 
     def _seems_username_column(self, user_token: str, next_token: str) -> bool:
         """Decide if user_token is a username column by combining validity and next token check."""
-        pattern_ok = re.match(r'^[A-Za-z_][A-Za-z0-9_-]*$', user_token) is not None
+        pattern_ok = _USER_RE.match(user_token) is not None
         if not pattern_ok:
             return False
         # If it's a system-style file, be liberal: accept username-looking token
@@ -213,61 +296,23 @@ class CronParser:
 
     def _remainder_after_tokens(self, line: str, token_count: int) -> str:
         """Return the remainder of the line after the first token_count whitespace-separated tokens."""
-        # Use regex to capture the remainder to preserve original spacing/args
-        pattern = r'^\s*(?:\S+\s+){' + str(token_count) + r'}(.*)$'
-        m = re.match(pattern, line)
-        return m.group(1) if m else ''
-
-    def _strip_inline_comment(self, s: str) -> str:
-        """Strip inline comments starting with #, respecting quotes."""
-        out = []
-        in_single = False
-        in_double = False
-        i = 0
-        while i < len(s):
-            ch = s[i]
-            if ch == "'" and not in_double:
-                in_single = not in_single
-                out.append(ch)
-            elif ch == '"' and not in_single:
-                in_double = not in_double
-                out.append(ch)
-            elif ch == '#' and not in_single and not in_double:
-                break  # comment starts here
-            else:
-                out.append(ch)
-            i += 1
-        return ''.join(out)
+        # maxsplit leaves the tail untouched, preserving original spacing/args
+        parts = line.split(None, token_count)
+        return parts[token_count] if len(parts) > token_count else ''
 
     def _split_commands(self, s: str) -> List[str]:
-        """Split a command string by semicolons not inside quotes (and not escaped)."""
+        """Split a command string by semicolons not inside quotes (and not escaped), dropping inline # comments."""
         parts: List[str] = []
         buf: List[str] = []
-        in_single = False
-        in_double = False
-        escape = False
-        for ch in s:
-            if escape:
-                buf.append(ch)
-                escape = False
-                continue
-            if ch == '\\':
-                buf.append(ch)
-                escape = True
-                continue
-            if ch == "'" and not in_double:
-                in_single = not in_single
-                buf.append(ch)
-                continue
-            if ch == '"' and not in_single:
-                in_double = not in_double
-                buf.append(ch)
-                continue
-            if ch == ';' and not in_single and not in_double:
+        # Quoted strings and escapes come back as single tokens, so a bare ';' or '#' is unquoted
+        for token in _CMD_TOKEN_RE.findall(s):
+            if token == ';':
                 parts.append(''.join(buf).strip())
                 buf = []
-                continue
-            buf.append(ch)
+            elif token == '#':
+                break  # comment starts here
+            else:
+                buf.append(token)
         if buf:
             parts.append(''.join(buf).strip())
         return parts
@@ -293,7 +338,7 @@ class CronParser:
         Returns:
             List[Dict[str, Any]]: List of cron entries that would run in the specified range
         """
-        if not self.entries:
+        if not self._parsed:
             self.parse()
             
         if end_time is None and time_span is not None:
@@ -304,14 +349,18 @@ class CronParser:
         if start_time > end_time:
             start_time, end_time = end_time, start_time
             
-        result = []
-        
+        # (next_time, entry) pairs; entries are only materialized after sorting
+        pending: List[Tuple[datetime, Dict[str, Any]]] = []
+        # Next run per expression for this scan; many entries share a schedule.
+        # None marks expressions croniter could not handle.
+        next_runs: Dict[str, Optional[datetime]] = {}
+
         for entry in self.entries:
             schedule = entry['schedule']
 
             # Expand special schedules; skip @reboot which has no time schedule
             if schedule.startswith('@'):
-                expanded = self._expand_special(schedule)
+                expanded = _expand_special(schedule)
                 if expanded is None:
                     # e.g., @reboot
                     continue
@@ -319,61 +368,32 @@ class CronParser:
             else:
                 expr = schedule
 
-            try:
-                # Compute the next run time inclusively from start_time
-                base = start_time - timedelta(minutes=1)
-                it = croniter(expr, base)
-                next_time = it.get_next(datetime)
-
-                # Check if the next scheduled time is within our range
-                if next_time <= end_time:
-                    # Add the next scheduled time to the entry
-                    entry_with_time = entry.copy()
-                    entry_with_time['next_run'] = next_time.isoformat()
-                    result.append(entry_with_time)
-            except Exception:
+            if expr in next_runs:
+                next_time = next_runs[expr]
+            else:
+                next_time = next_runs[expr] = self._next_run(expr, start_time)
+            if next_time is None:
                 # Skip entries that can't be parsed
                 continue
-                
-        # Sort by next run time
-        result.sort(key=lambda x: x.get('next_run', ''))
-        
-        return result
 
-    def _expand_special(self, special: str) -> Optional[str]:
-        """Expand @ macros to standard 5-field expressions. Return None for non-time-based macros."""
-        mapping = {
-            '@yearly': '0 0 1 1 *',
-            '@annually': '0 0 1 1 *',
-            '@monthly': '0 0 1 * *',
-            '@weekly': '0 0 * * 0',
-            '@daily': '0 0 * * *',
-            '@midnight': '0 0 * * *',
-            '@hourly': '0 * * * *',
-        }
-        if special == '@reboot':
-            return None
-        return mapping.get(special, special)
+            # Check if the next scheduled time is within our range
+            if next_time <= end_time:
+                pending.append((next_time, entry))
 
-    def _describe_schedule(self, schedule: str) -> str:
-        """Return a human-readable description of a cron schedule.
+        # Sort by next run time on the datetimes themselves, then add the next
+        # scheduled time to each entry in a single dict build
+        pending.sort(key=itemgetter(0))
+        return [{**entry, 'next_run': next_time.isoformat()} for next_time, entry in pending]
 
-        Uses cron-descriptor with 24-hour time format. Supports @macros; returns a
-        friendly phrase for @reboot. Falls back to the raw schedule on error.
+    def _next_run(self, expr: str, start_time: datetime) -> Optional[datetime]:
         """
-        try:
-            # Expand @macros except @reboot
-            if schedule.startswith('@'):
-                expanded = self._expand_special(schedule)
-                if expanded is None:
-                    return 'At reboot'
-                expr = expanded
-            else:
-                expr = schedule
+        Return the first run of expr at or after the minute containing start_time.
 
-            options = CronOptions()
-            options.use_24hour_time_format = True
-            return cron_get_description(expr, options)
+        Returns None if croniter cannot handle the expression.
+        """
+        try:
+            # Compute the next run time inclusively from start_time
+            base = start_time - timedelta(minutes=1)
+            return _ShimCroniter(expr, base).get_next(datetime)
         except Exception:
-            # Fallback to the schedule string if description cannot be generated
-            return schedule
+            return None
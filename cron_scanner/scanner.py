@@ -4,40 +4,52 @@ Cron Scanner - A tool to scan and analyze crontab entries within a specified tim
 """
 
 import os
+import re
 import sys
 import argparse
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Type
 from .parser import CronParser
-from .formatters import (
-    CSVFormatter, JSONFormatter, XLSXFormatter, TextFormatter, PDFFormatter, MarkdownFormatter
-)
+from . import formatters
+from .formatters import BaseFormatter
+from .formatters.base import get_all_fields
 from . import __version__ as APP_VERSION
 
-# Map of format names to formatter classes
+try:
+    from ciso8601 import parse_datetime as _parse_iso  # type: ignore
+except ImportError:  # pragma: no cover - optional 'fast' extra
+    _parse_iso = None
+
+# The documented YYYY-MM-DD[THH:MM] shapes; ciso8601 alone would accept a much wider
+# ISO 8601 grammar (week dates, seconds, 24:00, ...) than the strptime fallback
+_ISO_SHAPE_RE = re.compile(r'\d{4}-\d{2}-\d{2}(?:[T ](?:[01]\d|2[0-3]):[0-5]\d)?', re.ASCII)
+
+# Map of format names to formatter class names in cron_scanner.formatters; classes
+# are looked up on first use so XLSX/PDF backends are only imported when requested
 FORMATTERS = {
-    'csv': CSVFormatter,
-    'json': JSONFormatter,
-    'xlsx': XLSXFormatter,
-    'text': TextFormatter,
-    'pdf': PDFFormatter,
-    'md': MarkdownFormatter,
-    'markdown': MarkdownFormatter
+    'csv': 'CSVFormatter',
+    'json': 'JSONFormatter',
+    'xlsx': 'XLSXFormatter',
+    'text': 'TextFormatter',
+    'pdf': 'PDFFormatter',
+    'md': 'MarkdownFormatter',
+    'markdown': 'MarkdownFormatter'
 }
 
 class CronScanner:
     """Main class for the Cron Scanner application."""
     
-    def __init__(self, crontab_content: str = None, filename: str = None):
+    def __init__(self, crontab_content: str = None, filename: str = None, describe: bool = True):
         """
         Initialize the CronScanner.
         
         Args:
             crontab_content: Raw crontab content as a string
             filename: Path to a crontab file
+            describe: Include a human-readable description of each schedule
         """
-        self.parser = CronParser(crontab_content, filename)
-        self.formatters = {name: formatter() for name, formatter in FORMATTERS.items()}
+        self.parser = CronParser(crontab_content, filename, describe=describe)
+        self.formatters: Dict[str, BaseFormatter] = {}  # Instances, created on first use
     
     def scan(self, 
             start_time: datetime,
@@ -59,7 +71,8 @@ class CronScanner:
     def export(self, 
               entries: List[Dict[str, Any]], 
               output_format: str = 'csv',
-              output_file: Optional[str] = None) -> str:
+              output_file: Optional[str] = None,
+              fields: Optional[List[str]] = None) -> str:
         """
         Export the cron entries in the specified format.
         
@@ -67,6 +80,8 @@ class CronScanner:
             entries: List of cron entries to export
             output_format: Output format (csv, json, xlsx, text, pdf, md, markdown)
             output_file: Path to the output file (optional)
+            fields: Field order from get_all_fields(entries) (optional); pass it
+                when exporting the same entries in several formats to compute it once
             
         Returns:
             str: The exported content or path to the output file
@@ -74,12 +89,19 @@ class CronScanner:
         Raises:
             ValueError: If the output format is not supported
         """
-        if output_format not in self.formatters:
+        if output_format not in FORMATTERS:
             raise ValueError(f"Unsupported output format: {output_format}. "
-                           f"Available formats: {', '.join(self.formatters.keys())}")
+                           f"Available formats: {', '.join(FORMATTERS.keys())}")
         
-        formatter = self.formatters[output_format]
-        return formatter.format(entries, output_file)
+        if fields is None and not self.parser.describe:
+            # Canonical fields are always exported; drop the description column explicitly
+            fields = [field for field in get_all_fields(entries) if field != 'description']
+
+        formatter = self.formatters.get(output_format)
+        if formatter is None:
+            formatter_class = getattr(formatters, FORMATTERS[output_format])
+            formatter = self.formatters[output_format] = formatter_class()
+        return formatter.format(entries, output_file, fields)
 
 def parse_args():
     """Parse command-line arguments."""
@@ -122,6 +144,12 @@ def parse_args():
         default='csv',
         help='Output format'
     )
+    output_group.add_argument(
+        '--no-description',
+        dest='describe',
+        action='store_false',
+        help='Omit the human-readable schedule description column (faster on large crontabs)'
+    )
     
     # Other options
     parser.add_argument(
@@ -133,7 +161,19 @@ def parse_args():
     return parser.parse_args()
 
 def parse_datetime(dt_str: str) -> datetime:
-    """Parse a datetime string in YYYY-MM-DD[THH:MM] format."""
+    """Parse a datetime string in YYYY-MM-DD[THH:MM] format.
+
+    Uses ciso8601 when it is installed and falls back to strptime otherwise;
+    both accept the same inputs.
+    """
+    if _parse_iso is not None and _ISO_SHAPE_RE.fullmatch(dt_str):
+        try:
+            dt = _parse_iso(dt_str)
+        except ValueError:
+            dt = None
+        if dt is not None:
+            return dt
+
     formats = [
         '%Y-%m-%dT%H:%M',  # YYYY-MM-DDTHH:MM
         '%Y-%m-%d %H:%M',  # YYYY-MM-DD HH:MM
@@ -154,7 +194,6 @@ def parse_timespan(span_str: str) -> timedelta:
         raise ValueError("Empty time span")
     
     # Match all numbers followed by their units
-    import re
     pattern = r'(\d+)([dhm])'
     matches = re.findall(pattern, span_str)
     
@@ -199,7 +238,7 @@ def main():
             time_span = timedelta(days=1)
         
         # Initialize the scanner
-        scanner = CronScanner(filename=args.file)
+        scanner = CronScanner(filename=args.file, describe=args.describe)
         
         # Scan for entries in the specified time range
         entries = scanner.scan(start_time, end_time, time_span)
@@ -223,19 +262,27 @@ def main():
             output_file=output_path
         )
 
+        # Collect messages per stream so each one gets a single write
+        stdout_msgs: List[str] = []
+        stderr_msgs = [f"Found {len(entries)} cron jobs scheduled in the specified time range."]
+
         # If export returned content (for formats that allow stdout), and user explicitly
         # asked for no output file, print it. Otherwise, inform where we wrote the file.
         if args.output is None or args.output:
-            print(f'Output written to: {exported}')
-            
-        print(f"Found {len(entries)} cron jobs scheduled in the specified time range.", file=sys.stderr)
+            stdout_msgs.append(f'Output written to: {exported}')
+
+        if stdout_msgs:
+            sys.stdout.write('\n'.join(stdout_msgs) + '\n')
+            sys.stdout.flush()
+        sys.stderr.write('\n'.join(stderr_msgs) + '\n')
         
         return 0
         
     except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
+        message = f"Error: {e}\n"
         if '--help' not in sys.argv and '-h' not in sys.argv:
-            print("\nUse --help for usage information.", file=sys.stderr)
+            message += "\nUse --help for usage information.\n"
+        sys.stderr.write(message)
         return 1
 
 if __name__ == "__main__":